@@ -1,10 +1,13 @@
 import tkinter as tk
 import random
+import heapq
+import array
 import time
-import pandas as pd
+import math
 import csv
+import atexit
+import threading
 from time import gmtime, strftime
-import matplotlib.pyplot as plt
 
 
 
@@ -16,16 +19,76 @@ square_color = 'blue'
 
 # Helpers
 
-def add_row_to_csv(filename, row):
+class ScoreStore:
     """
-    Adds a single row to an existing CSV file.
-
-    :param filename: path to the csv file
-    :param row: list of values, e.g. ["Alice", 42, "2026-01-08"]
+    Keeps all scores of the CSV file in memory.
+    New rows are collected and written to the file in one go on flush().
+    The file stays open for appending until close().
+    flush() may be called from a worker thread.
     """
-    with open(filename, mode="a", newline="\n", encoding="utf-8") as file:
-        writer = csv.writer(file)
-        writer.writerow(row)
+
+    def __init__(self, filename):
+        self._rows = []
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        # Load existing scores once
+        with open(filename, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader)  # header
+            for row in reader:
+                if not row:
+                    continue  # skip blank lines
+                date, score, name, misses, accuracy = row
+                self._rows.append((date, int(score), name, int(misses), float(accuracy)))
+
+        self._flushed = len(self._rows)
+
+        # Open once for appending and reuse the handle for every flush
+        self._csv_fh = open(filename, mode="a", newline="\n", encoding="utf-8", buffering=1)
+        self._csv_writer = csv.writer(self._csv_fh)
+        atexit.register(self.close)
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def append(self, row):
+        """
+        Adds a row to the in-memory scores. It is written on the next flush().
+
+        :param row: list of values, e.g. ["08.01.2026 11:11", 10, "", 3, 0.77]
+        """
+        with self._lock:
+            self._rows.append(tuple(row))
+            self._dirty = True
+
+    def flush(self):
+        """Appends all pending rows to the CSV file."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._dirty or self._csv_fh.closed:
+            return
+
+        pending = self._rows[self._flushed:]
+        self._csv_writer.writerows(pending)
+
+        self._flushed = len(self._rows)
+        self._dirty = False
+
+    def close(self):
+        """Writes pending rows and closes the CSV file."""
+        with self._lock:
+            if self._csv_fh.closed:
+                return
+
+            self._flush()
+            self._csv_fh.close()
 
 class CanvasButton:
     """
@@ -34,6 +97,9 @@ class CanvasButton:
     - drawing
     - hover effect
     - click detection
+
+    Mouse events are dispatched to on_enter/on_leave/on_click by the
+    canvas-level handlers of ClickSquareGame.
     """
 
     def __init__(self, canvas, x, y, width, height, text, command,
@@ -65,16 +131,6 @@ class CanvasButton:
             font=font
         )
 
-        # Bind events
-        canvas.tag_bind(self.rect, "<Enter>", self.on_enter)
-        canvas.tag_bind(self.text, "<Enter>", self.on_enter)
-
-        canvas.tag_bind(self.rect, "<Leave>", self.on_leave)
-        canvas.tag_bind(self.text, "<Leave>", self.on_leave)
-
-        canvas.tag_bind(self.rect, "<Button-1>", self.on_click)
-        canvas.tag_bind(self.text, "<Button-1>", self.on_click)
-
     def on_enter(self, event):
         """Mouse enters button area"""
         self.canvas.itemconfig(self.rect, fill=self.hover_bg)
@@ -110,19 +166,46 @@ class ClickSquareGame:
         self.SQUARE_SIZE = 10
         self.GAME_DURATION = 15.00  # seconds
 
+        # Window is not resizable, so the spawn area never changes
+        self._max_x = self.WIDTH - self.SQUARE_SIZE
+        self._max_y = self.HEIGHT - self.SQUARE_SIZE
+
+        # Own random generator, randint looked up once for spawn_square
+        self._rand = random.Random()
+        self._randint = self._rand.randint
+
         # === GAME STATE ===
         self.score = 0
         self.misses = 0
         self.time_left = self.GAME_DURATION
         self.game_running = False
         self.start_time = None
+        self._end_after_id = None    # scheduled end of the game
+        self._tick_after_id = None   # scheduled timer label update
+        self._flash_after_id = None  # scheduled end of the miss flash
+        self._last_time_shown = None  # whole seconds shown in the time label
+        self._countdown_id = None
         self.square_id = None
+        self._sx = 0   # top-left corner of the current square
+        self._sy = 0
 
-        self.reaction_times = []   # list of milliseconds per hit
+        self.reaction_times = array.array('d')   # milliseconds per hit
+        self._rt_sum = 0.0   # running sum of reaction_times
         self.click_count = 0
         self.square_spawn_time = None
         self.last_row_id = None   # to mark ranking row later
 
+        self._buttons = {}   # canvas item id -> CanvasButton
+        self._hovered_button = None
+
+        self.scores = ScoreStore('scores.csv')
+
+        # Top 10 runs as min-heap of (score, row_id, date, accuracy)
+        self.top10 = []
+        for row_id, (date, score, name, misses, accuracy) in enumerate(self.scores.rows):
+            self.add_to_top10((score, row_id, date, accuracy))
+
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         # === GUI SETUP ===
         self.setup_ui()
@@ -153,7 +236,7 @@ class ClickSquareGame:
         # Time label (top-left corner)
         self.time_label = tk.Label(
             self.root,
-            text=f"Time: {self.time_left} s",
+            text=f"Time: {math.ceil(self.time_left)} s",
             font=("Arial", 14),
             fg=contrast_color,
             bg=background_color
@@ -163,6 +246,10 @@ class ClickSquareGame:
         # Bind mouse clicks on canvas
         self.canvas.bind("<Button-1>", self.handle_click)
 
+        # One hover handler for all canvas buttons
+        self.canvas.bind("<Motion>", self._on_canvas_motion)
+        self.canvas.bind("<Leave>", self._on_canvas_motion)
+
         # Start the game immediately
         self.start_game()
 
@@ -171,18 +258,11 @@ class ClickSquareGame:
         Displays 3-2-1 countdown before the game starts.
         """
 
-        self.canvas.delete("all")
-
         if count > 0:
-            self.canvas.create_text(
-                self.WIDTH // 2,
-                self.HEIGHT // 2,
-                text=str(count),
-                fill=contrast_color,
-                font=("Arial", 72, "bold")
-            )
-            self.root.after(1000, lambda: self.show_countdown(count - 1))
+            self.canvas.itemconfigure(self._countdown_id, text=str(count))
+            self.root.after(1000, self.show_countdown, count - 1)
         else:
+            self.canvas.delete(self._countdown_id)
             self.begin_game()
 
 
@@ -199,11 +279,20 @@ class ClickSquareGame:
 
         # Update UI
         self.score_label.config(text="Score: 0")
-        self.time_label.config(text=f"Time: {self.GAME_DURATION} s")
+        self._last_time_shown = math.ceil(self.GAME_DURATION)
+        self.time_label.config(text=f"Time: {self._last_time_shown} s")
         self.canvas.delete("all")
+        self.clear_buttons()
         self.canvas.config(bg=background_color)
 
-        # Start countdown
+        # Start countdown (one text item, updated every second)
+        self._countdown_id = self.canvas.create_text(
+            self.WIDTH // 2,
+            self.HEIGHT // 2,
+            text="",
+            fill=contrast_color,
+            font=("Arial", 72, "bold")
+        )
         self.show_countdown(5)
 
     def begin_game(self):
@@ -212,42 +301,46 @@ class ClickSquareGame:
         """
 
         self.canvas.delete("all")
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.game_running = True
 
+        # The square is created once per game and only moved afterwards
+        self.square_id = self.canvas.create_rectangle(
+            0,
+            0,
+            self.SQUARE_SIZE,
+            self.SQUARE_SIZE,
+            fill=square_color,
+            outline="",
+            state="hidden"
+        )
+
         self.spawn_square()
-        self.update_timer()
+
+        # Hard deadline for the game, the label is updated separately
+        self._end_after_id = self.root.after(int(self.GAME_DURATION * 1000), self.end_game)
+        self._tick_after_id = self.root.after(200, self.update_timer)
 
 
     def spawn_square(self):
         """
-        Creates a square fully inside the visible canvas area.
+        Moves the square to a random position fully inside the visible canvas area.
         """
 
-        if self.square_id:
-            self.canvas.delete(self.square_id)
-
-        # Force update to get correct size
-        self.canvas.update_idletasks()
+        x = self._randint(0, self._max_x)
+        y = self._randint(0, self._max_y)
+        self._sx = x
+        self._sy = y
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        max_x = canvas_width - self.SQUARE_SIZE
-        max_y = canvas_height - self.SQUARE_SIZE
-
-        x = random.randint(0, max_x)
-        y = random.randint(0, max_y)
-
-        self.square_id = self.canvas.create_rectangle(
+        self.canvas.coords(
+            self.square_id,
             x,
             y,
             x + self.SQUARE_SIZE,
-            y + self.SQUARE_SIZE,
-            fill=square_color,
-            outline=""
+            y + self.SQUARE_SIZE
         )
-        self.square_spawn_time = time.time()
+        self.canvas.itemconfigure(self.square_id, state="normal")
+        self.square_spawn_time = time.perf_counter()
 
 
     def handle_click(self, event):
@@ -255,20 +348,24 @@ class ClickSquareGame:
         Handles mouse clicks:
         - If square is hit -> score increases and new square spawns
         - If miss -> screen flashes white
+        - If the game is over -> clicks go to the canvas buttons
         """
 
         if not self.game_running:
+            button = self._button_under_cursor()
+            if button is not None:
+                button.on_click(event)
             return
 
-        clicked_items = self.canvas.find_overlapping(event.x, event.y, event.x, event.y)
-
-        if self.square_id in clicked_items:
+        if (self._sx <= event.x < self._sx + self.SQUARE_SIZE
+                and self._sy <= event.y < self._sy + self.SQUARE_SIZE):
             # HIT
             self.score += 1
             self.click_count += 1
 
-            reaction_time = (time.time() - self.square_spawn_time) * 1000  # ms
+            reaction_time = (time.perf_counter() - self.square_spawn_time) * 1000  # ms
             self.reaction_times.append(reaction_time)
+            self._rt_sum += reaction_time
 
             self.score_label.config(text=f"Score: {self.score}")
             self.spawn_square()
@@ -278,32 +375,83 @@ class ClickSquareGame:
             self.misses += 1
             self.flash_screen()
 
+    def add_button(self, **kwargs):
+        """
+        Creates a CanvasButton and registers it for the canvas-level event handlers.
+        """
+
+        button = CanvasButton(canvas=self.canvas, **kwargs)
+        self._buttons[button.rect] = button
+        self._buttons[button.text] = button
+        return button
+
+    def clear_buttons(self):
+        """
+        Forgets all registered buttons (their items are deleted with the canvas).
+        """
+
+        self._buttons.clear()
+        self._hovered_button = None
+
+    def _button_under_cursor(self):
+        current = self.canvas.find_withtag("current")
+        return self._buttons.get(current[0]) if current else None
+
+    def _on_canvas_motion(self, event):
+        """
+        Updates the hover state of the canvas buttons.
+        """
+
+        # No buttons while playing, skip the Tk lookup
+        if self.game_running or not self._buttons:
+            return
+
+        button = self._button_under_cursor()
+        if button is self._hovered_button:
+            return
+
+        if self._hovered_button is not None:
+            self._hovered_button.on_leave(event)
+        if button is not None:
+            button.on_enter(event)
+
+        self._hovered_button = button
+
     def flash_screen(self):
         """
         Flashes the screen briefly to indicate a miss.
         """
 
+        # Restart a running flash instead of stacking callbacks
+        if self._flash_after_id is not None:
+            self.root.after_cancel(self._flash_after_id)
+
         self.canvas.config(bg=contrast_color)
-        self.root.after(100, lambda: self.canvas.config(bg=background_color))
+        self._flash_after_id = self.root.after(100, self._end_flash)
+
+    def _end_flash(self):
+        """Restores the background after a miss flash."""
+        self.canvas.config(bg=background_color)
+        self._flash_after_id = None
 
     def update_timer(self):
         """
-        Updates the countdown timer and ends the game when time is up.
+        Updates the countdown timer label. The game itself is ended by end_game.
         """
 
         if not self.game_running:
             return
 
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         remaining = max(0, self.GAME_DURATION - elapsed)
 
-        # Update label
-        self.time_label.config(text=f"Time: {remaining:.2f} s")
+        # Update label only when the whole seconds change
+        shown = math.ceil(remaining)
+        if shown != self._last_time_shown:
+            self.time_label.config(text=f"Time: {shown} s")
+            self._last_time_shown = shown
 
-        if remaining <= 0:
-            self.end_game()
-        else:
-            self.root.after(100, self.update_timer)
+        self._tick_after_id = self.root.after(200, self.update_timer)
 
 
     def save_score(self):
@@ -313,27 +461,61 @@ class ClickSquareGame:
         misses = self.misses
         accuracy = float(score) / (misses + score) if (misses + score) > 0 else 0.0
 
-        add_row_to_csv('scores.csv', [date, score, name, misses, accuracy])
+        self.scores.append([date, score, name, misses, accuracy])
 
         # store row index of this run
-        df = pd.read_csv('scores.csv')
-        self.last_row_id = len(df) - 1
+        self.last_row_id = len(self.scores) - 1
+        self.add_to_top10((score, self.last_row_id, date, accuracy))
+
+    def add_to_top10(self, entry):
+        """
+        Adds a run to the top 10 heap and drops the lowest one if it gets too long.
+        """
+
+        heapq.heappush(self.top10, entry)
+        if len(self.top10) > 10:
+            heapq.heappop(self.top10)
+
+    def close(self):
+        """
+        Writes pending scores and closes the window.
+        """
+
+        # Don't let a running game end during teardown
+        if self.game_running:
+            self.root.after_cancel(self._end_after_id)
+            self.root.after_cancel(self._tick_after_id)
+
+        self.scores.close()
+        self.root.destroy()
 
     def plot_reaction_times(self):
         if not self.reaction_times:
             return
 
+        # only loaded when the plot is requested
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         x = list(range(1, len(self.reaction_times) + 1))
         y = self.reaction_times
 
-        plt.figure(figsize=(6, 4))
-        plt.plot(x, y, marker='o')
-        plt.xlabel("Button Number")
-        plt.ylabel("Reaction Time (ms)")
-        plt.title("Reaction Time per Click")
-        plt.grid(True)
-        plt.tight_layout()
-        plt.show()
+        # Show the plot in a window of this app instead of a pyplot window
+        top = tk.Toplevel(self.root)
+        top.title("Reaction Time per Click")
+
+        fig = Figure(figsize=(6, 4))
+        ax = fig.add_subplot()
+        ax.plot(x, y, marker='o')
+        ax.set_xlabel("Button Number")
+        ax.set_ylabel("Reaction Time (ms)")
+        ax.set_title("Reaction Time per Click")
+        ax.grid(True)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=top)
+        canvas.get_tk_widget().pack()
+        canvas.draw_idle()
 
 
 
@@ -343,25 +525,33 @@ class ClickSquareGame:
         """
 
         self.game_running = False
-        self.canvas.delete("all")
+        self.root.after_cancel(self._tick_after_id)
+        self.time_label.config(text="Time: 0 s")
+
+        self.canvas.delete("all")  # also removes the square of this game
+        self.square_id = None
+        self.clear_buttons()
 
         self.save_score()
 
+        # Write the score to the CSV file without blocking the end screen
+        threading.Thread(target=self.scores.flush, daemon=True).start()
+
         # Draw final score text
         accuracy = float(self.score) / (self.misses + self.score) if (self.misses + self.score) > 0 else 0.0
+        average_time = self._rt_sum / self.click_count / 1000 if self.click_count > 0 else 0.0
 
         self.canvas.create_text(
             self.WIDTH // 2,
             110,
-            text=f"Time's up!\nFinal Score: {self.score}\nAccuracy: {accuracy*100:.2f}%\nAverage time: {sum(self.reaction_times)/float(self.click_count)/1000:.2f} s",
+            text=f"Time's up!\nFinal Score: {self.score}\nAccuracy: {accuracy*100:.2f}%\nAverage time: {average_time:.2f} s",
             fill=contrast_color,
             font=("Arial", 22),
             justify="center"
         )
 
         # Show Plot
-        self.plot_btn = CanvasButton(
-            canvas=self.canvas,
+        self.plot_btn = self.add_button(
             x=self.WIDTH // 2 - 100,
             y=220,
             width=200,
@@ -372,8 +562,7 @@ class ClickSquareGame:
 
 
         # Create Repeat button
-        self.repeat_btn = CanvasButton(
-            canvas=self.canvas,
+        self.repeat_btn = self.add_button(
             x=self.WIDTH // 2 - 100,
             y=280,
             width=200,
@@ -383,56 +572,54 @@ class ClickSquareGame:
         )
 
         # Create Close button
-        self.close_btn = CanvasButton(
-            canvas=self.canvas,
+        self.close_btn = self.add_button(
             x=self.WIDTH // 2 - 100,
             y=340,
             width=200,
             height=45,
             text="Close Game",
-            command=self.root.destroy
+            command=self.close
         )
 
         # Ranking
-        scores_df = pd.read_csv('scores.csv')
-        scores_df = scores_df.sort_values(by='score', ascending=False).head(10).reset_index()
+        ranking = sorted(self.top10, reverse=True)
 
         y_start = 400
-        line_height = 28
 
         header = "Rank  Score  Accuracy   Date"
-        self.canvas.create_text(
+        rows = [
+            f"{i:<3} {score:>6.0f}   {accuracy*100:>6.2f}%   {date}"
+            for i, (score, _, date, accuracy) in enumerate(ranking, start=1)
+        ]
+        lines = [header, "-" * 40] + rows
+
+        # Row of this run, left blank here and drawn bold on top
+        current = next((i for i, entry in enumerate(ranking) if entry[1] == self.last_row_id), None)
+        if current is not None:
+            lines[current + 2] = ""   # 2 lines of header
+
+        # Whole table as one text item, centered as a block with left aligned lines
+        table_id = self.canvas.create_text(
             self.WIDTH // 2,
             y_start,
-            text=header,
+            text="\n".join(lines),
             fill=square_color,
-            font=("Courier New", 18, "bold"),
-            justify="center"
+            font=("Courier New", 18),
+            anchor="n",
+            justify="left"
         )
 
-        for i, row in enumerate(scores_df.itertuples(), start=1):
-            if i == 1:
-                medal = '🥇'
-            elif i == 2:
-                medal = '🥈'
-            elif i == 3:
-                medal = '🥉'
-            else:
-                medal = ' '
-
-            is_current = (row.Index == self.last_row_id)
-
-            font_style = ("Courier New", 18, "bold") if is_current else ("Courier New", 18)
-
-            line = f"{i:<3} {row.score:>6.0f}   {row.accuracy*100:>6.2f}%   {row.date}"
-
+        if current is not None:
+            x1, y1, x2, y2 = self.canvas.bbox(table_id)
+            line_height = (y2 - y1) / len(lines)
             self.canvas.create_text(
-                self.WIDTH // 2,
-                y_start + i * line_height,
-                text=line,
+                x1,
+                y1 + (current + 2) * line_height,
+                text=rows[current],
                 fill=square_color,
-                font=font_style,
-                justify="center"
+                font=("Courier New", 18, "bold"),
+                anchor="nw",
+                justify="left"
             )
 
 